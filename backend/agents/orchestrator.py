@@ -10,6 +10,21 @@ from loguru import logger
 import asyncio
 import json
 
+# Per-workflow concurrency caps so a request spike cannot saturate the
+# downstream HF/OCR services or the event loop
+_WORKFLOW_CONCURRENCY = {
+    "expense_processing": 16,
+    "invoice_creation": 32,
+    "fraud_detection": 32,
+    "cashflow_forecast": 8,
+}
+_ACQUIRE_TIMEOUT = float(os.getenv("WORKFLOW_ACQUIRE_TIMEOUT_S", "5"))
+_WORKFLOW_TIMEOUT = float(os.getenv("WORKFLOW_TIMEOUT_S", "30"))
+
+
+class WorkflowCapacityError(Exception):
+    """Raised when a workflow type is at its concurrency limit"""
+
 
 class WorkflowOrchestrator:
     """
@@ -43,6 +58,12 @@ class WorkflowOrchestrator:
             "cashflow_forecast": self._cashflow_forecast_workflow
         }
         
+        # Concurrency limits per workflow type
+        self._semaphores = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in _WORKFLOW_CONCURRENCY.items()
+        }
+
         # Active workflows tracking
         self.active_workflows = {}
         
@@ -85,9 +106,24 @@ class WorkflowOrchestrator:
             workflow_func = self.workflows.get(workflow_type)
             if not workflow_func:
                 raise ValueError(f"Unknown workflow type: {workflow_type}")
-            
-            # Execute workflow
-            result = await workflow_func(data, workflow_id)
+
+            # Execute workflow under its concurrency cap, with a timeout so
+            # hung workflows don't leak semaphore slots
+            sem = self._semaphores.get(workflow_type)
+            if sem is not None:
+                try:
+                    await asyncio.wait_for(sem.acquire(), timeout=_ACQUIRE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    raise WorkflowCapacityError(
+                        f"Workflow '{workflow_type}' is at capacity, try again later"
+                    )
+            try:
+                result = await asyncio.wait_for(
+                    workflow_func(data, workflow_id), timeout=_WORKFLOW_TIMEOUT
+                )
+            finally:
+                if sem is not None:
+                    sem.release()
             
             # Update workflow status
             self.active_workflows[workflow_id].update({
@@ -126,14 +162,15 @@ class WorkflowOrchestrator:
         4. Cashflow Forecast Update
         """
         logger.info(f"[{workflow_id}] Step 1: OCR & Classification")
-        
+
         # Step 1: Process receipt with Expense Classifier
         file = data.get("file")
         user_id = data.get("user_id")
-        
-        # Read file content
-        file_content = await file.read()
-        
+
+        # Read the spooled file handle off the event loop (it may be
+        # disk-backed for large uploads)
+        file_content = await asyncio.to_thread(file.read)
+
         expense_result = await self.expense_classifier.process_receipt(
             file_content=file_content,
             filename=data.get("filename"),
@@ -5,9 +5,12 @@ Avoid heavy ML/ocr/payment dependencies. Returns plausible demo outputs.
 from __future__ import annotations
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+from collections import defaultdict
 from loguru import logger
 import asyncio
+import os
 import random
+import threading
 import base64
 import io
 
@@ -15,12 +18,33 @@ import io
 _expense_storage = {}
 _invoice_storage = {}
 
+# Optional artificial latency for demo realism (seconds). Defaults to 0 so
+# load tests and scripted runs are not throttled by fake I/O waits.
+_FAKE_LATENCY = float(os.getenv("DEMO_FAKE_LATENCY_MS", "0")) / 1000
+
+# Pre-formatted ISO dates shared across forecast calls, refreshed when the
+# day rolls over so the hot path is a slice instead of 30 date constructions
+_ISO_DATES: List[str] = []
+_ISO_DATES_DAY = None
+
+
+def _iso_dates(days: int) -> List[str]:
+    """Return the next `days` ISO date strings starting from today."""
+    global _ISO_DATES, _ISO_DATES_DAY
+    today = datetime.utcnow().date()
+    if _ISO_DATES_DAY != today:
+        _ISO_DATES = [(today + timedelta(days=i)).isoformat() for i in range(400)]
+        _ISO_DATES_DAY = today
+    return _ISO_DATES[:days]
+
 
 class ExpenseClassifierAgent:
     def __init__(self, huggingface_service=None):
         self.name = "ExpenseClassifierAgentStub"
         self.hf_service = huggingface_service
         self.expenses_by_user = {}  # Track expenses for analytics
+        # Per-user locks so concurrent uploads don't interleave writes
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         logger.info(f"✅ {self.name} initialized (stub)")
 
     def health_status(self) -> Dict:
@@ -58,10 +82,9 @@ class ExpenseClassifierAgent:
         }
         
         # Store expense for analytics
-        if user_id not in self.expenses_by_user:
-            self.expenses_by_user[user_id] = []
-        self.expenses_by_user[user_id].append(result)
-        
+        async with self._locks[user_id]:
+            self.expenses_by_user.setdefault(user_id, []).append(result)
+
         return result
     
     def get_receipt(self, expense_id: str) -> Optional[Dict]:
@@ -158,6 +181,14 @@ class InvoiceAgent:
     def __init__(self):
         self.name = "InvoiceAgentStub"
         self.invoices_by_user = {}  # Track invoices for management
+        # Per-user locks for async writes; a plain threading.Lock guards the
+        # sync read-modify-write in update_invoice_status
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._status_lock = threading.Lock()
+        # Status buckets (user_id -> payment_status -> invoices) so status
+        # filters are an O(1) lookup instead of rescanning the full list
+        self._by_status: Dict[str, Dict[str, List[Dict]]] = defaultdict(lambda: defaultdict(list))
+        self._owner_by_id: Dict[str, str] = {}
         logger.info(f"✅ {self.name} initialized (stub)")
 
     def health_status(self) -> Dict:
@@ -221,10 +252,11 @@ Thank you for your business!
         }
         
         # Store invoice for tracking
-        if user_id not in self.invoices_by_user:
-            self.invoices_by_user[user_id] = []
-        self.invoices_by_user[user_id].append(invoice_data)
-        
+        async with self._locks[user_id]:
+            self.invoices_by_user.setdefault(user_id, []).append(invoice_data)
+            self._by_status[user_id][invoice_data["payment_status"]].append(invoice_data)
+            self._owner_by_id[invoice_id] = user_id
+
         return invoice_data
     
     def get_invoice_pdf(self, invoice_id: str) -> Optional[str]:
@@ -271,21 +303,32 @@ Thank you for your business!
             ]
         
         if status:
-            invoices = [inv for inv in invoices if inv.get("payment_status") == status]
-        
+            # Pre-indexed bucket instead of filtering the full list per query
+            return list(self._by_status[user_id][status])
+
         return invoices
     
     def update_invoice_status(self, invoice_id: str, payment_status: str) -> bool:
         """Update invoice payment status"""
-        for user_invoices in self.invoices_by_user.values():
-            for invoice in user_invoices:
+        with self._status_lock:
+            user_id = self._owner_by_id.get(invoice_id)
+            if user_id is None:
+                return False
+            for invoice in self.invoices_by_user.get(user_id, []):
                 if invoice["invoice_id"] == invoice_id:
+                    old_status = invoice["payment_status"]
                     invoice["payment_status"] = payment_status
+                    # Keep the status buckets in sync
+                    bucket = self._by_status[user_id][old_status]
+                    if invoice in bucket:
+                        bucket.remove(invoice)
+                    self._by_status[user_id][payment_status].append(invoice)
                     return True
         return False
 
     async def send_invoice(self, invoice_id: str):
-        await asyncio.sleep(0.1)
+        if _FAKE_LATENCY:
+            await asyncio.sleep(_FAKE_LATENCY)
         logger.info(f"Invoice sent (stub): {invoice_id}")
 
 
@@ -299,8 +342,7 @@ class CashflowForecastAgent:
         return {"agent": self.name, "status": "healthy", "stub": True}
 
     async def generate_forecast(self, user_id: str) -> Dict:
-        today = datetime.utcnow().date()
-        net_series = [{"date": (today + timedelta(days=i)).isoformat(), "value": 1000 + i * 5} for i in range(30)]
+        net_series = [{"date": d, "value": 1000 + i * 5} for i, d in enumerate(_iso_dates(30))]
         return {
             "forecast_id": f"fc_{datetime.utcnow().strftime('%H%M%S')}",
             "user_id": user_id,
@@ -317,5 +359,6 @@ class CashflowForecastAgent:
         }
 
     async def incremental_update(self, user_id: str, new_data: Dict):
-        await asyncio.sleep(0.05)
+        if _FAKE_LATENCY:
+            await asyncio.sleep(_FAKE_LATENCY)
         logger.info("Cashflow incremental update (stub)")
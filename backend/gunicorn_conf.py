@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for production deployments
+Run: gunicorn main:app -c gunicorn_conf.py
+
+Each worker is a full uvicorn ASGI process, so the FastAPI lifespan runs
+once per worker and agents/services are initialized per process.
+"""
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", (2 * (os.cpu_count() or 1)) + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+keepalive = 5
+graceful_timeout = 30
+timeout = 60
@@ -3,23 +3,42 @@ FinAgent Pro - Main Application Entry Point
 Enterprise Multi-Agent Financial Automation Platform
 """
 
-from fastapi import FastAPI, HTTPException, File, UploadFile, Depends
+from fastapi import FastAPI, HTTPException, File, UploadFile, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 from loguru import logger
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import hmac
+import inspect
+import orjson
 import os
-from pydantic import BaseModel
+import sys
+import tempfile
+from pydantic import BaseModel, Field
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
 
+# Configure logging once: level from env, optional JSON serialization so a
+# whole record goes out in one write when logs are shipped to a collector
+logger.remove()
+logger.add(
+    sys.stderr,
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    serialize=os.getenv("LOG_SERIALIZE", "0").lower() in {"1", "true", "yes"}
+)
+
 # Import agents
 DEMO_MODE = os.getenv("DEMO_MODE", "0").lower() in {"1", "true", "yes"}
-logger.info(f"🔧 DEMO_MODE = {DEMO_MODE} (from env: {os.getenv('DEMO_MODE')})")
+
+# Webhook API key, read once at import instead of on every request
+_IBM_ORCH_KEY = os.getenv("IBM_ORCH_API_KEY")
+logger.info("🔧 DEMO_MODE = {mode} (from env: {raw})", mode=DEMO_MODE, raw=os.getenv("DEMO_MODE"))
 
 if DEMO_MODE:
     from agents.stubs import (
@@ -33,11 +52,12 @@ else:
     from agents.invoice_agent import InvoiceAgent
     from agents.fraud_analyzer import FraudAnalyzerAgent
     from agents.cashflow_forecast import CashflowForecastAgent
-from agents.orchestrator import WorkflowOrchestrator
+from agents.orchestrator import WorkflowOrchestrator, WorkflowCapacityError
 from agents.smart_assistant import SmartFinancialAssistant
 
 # Import services
 from services.database import DatabaseService, init_db
+from services.events import EventBroadcaster
 from services.storage import StorageService
 from services.auth import AuthService, get_current_user
 from services.huggingface_service import HuggingFaceService
@@ -67,20 +87,38 @@ async def lifespan(app: FastAPI):
     else:
         await init_db()
         logger.info("✅ Database initialized")
-    
-    # Initialize Hugging Face service
-    app.state.huggingface = HuggingFaceService()
+
+    # Shared database service so endpoints reuse one engine/pool instead of
+    # reinstantiating per request
+    app.state.db = DatabaseService()
+
+    # Event broadcaster for real-time WebSocket notifications
+    app.state.events = EventBroadcaster()
+
+    # Construct independent services concurrently in worker threads so
+    # startup takes max(init) instead of the sum (the HF service may block
+    # on warm-up work)
+    (
+        app.state.huggingface,
+        app.state.invoice_agent,
+        app.state.fraud_analyzer,
+        app.state.cashflow_forecast,
+    ) = await asyncio.gather(
+        asyncio.to_thread(HuggingFaceService),
+        asyncio.to_thread(InvoiceAgent),
+        asyncio.to_thread(FraudAnalyzerAgent),
+        asyncio.to_thread(CashflowForecastAgent),
+    )
     logger.info("✅ Hugging Face service initialized")
-    
-    # Initialize agents with HF service
+
+    # Warm local models in the background; requests arriving before the
+    # warmup finishes fall back to the API/simulated path
+    app.state.hf_warmup = asyncio.create_task(app.state.huggingface.warmup())
+
+    # These two depend on the HF service, so they follow the gather
     app.state.expense_classifier = ExpenseClassifierAgent(
         huggingface_service=app.state.huggingface if not DEMO_MODE else None
     )
-    app.state.invoice_agent = InvoiceAgent()
-    app.state.fraud_analyzer = FraudAnalyzerAgent()
-    app.state.cashflow_forecast = CashflowForecastAgent()
-    
-    # Initialize Smart Assistant
     app.state.smart_assistant = SmartFinancialAssistant(
         huggingface_service=app.state.huggingface
     )
@@ -106,6 +144,7 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 Shutting down FinAgent Pro...")
     if not DEMO_MODE:
         await app.state.orchestrator.stop_background_tasks()
+    await app.state.huggingface.aclose()
     logger.info("✅ Cleanup complete")
 
 
@@ -117,7 +156,8 @@ app = FastAPI(
     title="FinAgent Pro API",
     description="Intelligent Multi-Agent Financial Automation Platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
@@ -132,11 +172,34 @@ app.add_middleware(
         "http://127.0.0.1:5173",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let Starlette emit static preflight headers instead of
+    # echoing the client's requested headers on every OPTIONS
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-IBM-ORCH-KEY"],
+    # Browsers cache the preflight response for a day
+    max_age=86400,
 )
 
 
+def get_db(request: Request) -> DatabaseService:
+    """Dependency returning the shared DatabaseService from app state"""
+    return request.app.state.db
+
+
+# Centralized error handling: endpoints stay straight-line instead of each
+# wrapping its body in try/except, and raw exception text never reaches the
+# client
+@app.exception_handler(WorkflowCapacityError)
+async def _workflow_capacity_handler(request: Request, exc: WorkflowCapacityError):
+    return ORJSONResponse(status_code=503, content={"detail": str(exc)})
+
+
+@app.exception_handler(Exception)
+async def _unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception("Unhandled error on {method} {path}", method=request.method, path=request.url.path)
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
 # ==================== Health Check ====================
 
 # ==================== IBM Orchestrate Webhook ====================
@@ -145,78 +208,165 @@ class IBMOrchestrateEvent(BaseModel):
     payload: dict
 
 
+# ==================== AI Endpoint Request Models ====================
+
+class ChatQueryRequest(BaseModel):
+    query: str
+    user_id: str = "demo_user"
+    context: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BudgetAlertRequest(BaseModel):
+    user_id: str = "demo_user"
+    expenses: List[Dict[str, Any]] = Field(default_factory=list)
+    budget_limits: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "Travel": 10000,
+            "Software": 5000,
+            "Marketing": 8000
+        }
+    )
+
+
+class RecommendationsRequest(BaseModel):
+    user_id: str = "demo_user"
+    expenses: List[Dict[str, Any]] = Field(default_factory=list)
+    forecast_data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class TaxOptimizeRequest(BaseModel):
+    user_id: str = "demo_user"
+    expenses: List[Dict[str, Any]] = Field(default_factory=list)
+    user_profile: Dict[str, Any] = Field(default_factory=lambda: {"business_type": "LLC"})
+
+
+class VoiceCommandRequest(BaseModel):
+    transcript: str
+    user_id: str = "demo_user"
+
+
+class TeamInsightsRequest(BaseModel):
+    team_id: str = "demo_team"
+    expenses: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+# Webhook action handlers, routed via a precomputed dispatch table so each
+# call is a single dict lookup instead of a chain of membership tests
+async def _orch_expense_classify(payload: dict, app: FastAPI) -> dict:
+    agent = app.state.expense_classifier
+    return {"status": "ok", "result": agent.health_status() if hasattr(agent, "health_status") else {"agent": "expense", "status": "received"}}
+
+
+async def _orch_invoice_create(payload: dict, app: FastAPI) -> dict:
+    return {"status": "ok", "result": {"invoice_id": "inv_demo_001", "status": "created"}}
+
+
+async def _orch_fraud_scan(payload: dict, app: FastAPI) -> dict:
+    return {"status": "ok", "result": {"risk_score": 0.02, "flagged": False}}
+
+
+async def _orch_cashflow_forecast(payload: dict, app: FastAPI) -> dict:
+    return {"status": "ok", "result": {"forecast_days": 30, "trend": "stable"}}
+
+
+async def _orch_smart_chat(payload: dict, app: FastAPI) -> dict:
+    query = payload.get("query", "Hello")
+    return {"status": "ok", "result": {"reply": f"[DEMO] You asked: {query}"}}
+
+
+_ORCH_ACTIONS = {
+    "expense.classify": _orch_expense_classify,
+    "expense_classify": _orch_expense_classify,
+    "invoice.create": _orch_invoice_create,
+    "invoice_create": _orch_invoice_create,
+    "fraud.scan": _orch_fraud_scan,
+    "fraud_scan": _orch_fraud_scan,
+    "cashflow.forecast": _orch_cashflow_forecast,
+    "cashflow_forecast": _orch_cashflow_forecast,
+    "smart.chat": _orch_smart_chat,
+    "smart_chat": _orch_smart_chat,
+}
+
+
 @app.post("/webhooks/ibm-orchestrate")
-async def ibm_orchestrate_webhook(event: IBMOrchestrateEvent, request: Optional[object] = None):
+async def ibm_orchestrate_webhook(event: IBMOrchestrateEvent, request: Request):
     """
     Generic webhook for IBM watsonx Orchestrate to trigger FinAgent Pro actions.
     Secured via simple API key header: X-IBM-ORCH-KEY (optional in demo)
     """
     # Validate API key if set
-    expected = os.getenv("IBM_ORCH_API_KEY")
-    if expected:
-        try:
-            from starlette.requests import Request
-            if isinstance(request, Request):
-                provided = request.headers.get("X-IBM-ORCH-KEY")
-            else:
-                provided = None
-        except Exception:
-            provided = None
-        if provided != expected:
-            return JSONResponse(status_code=401, content={"error": "unauthorized"})
-
-    action = (event.action or "").lower().strip()
-    payload = event.payload or {}
-
-    # Route actions to initialized agents (stubs in DEMO_MODE)
-    if action in {"expense.classify", "expense_classify"}:
-        agent = app.state.expense_classifier
-        return {"status": "ok", "result": agent.health_status() if hasattr(agent, "health_status") else {"agent": "expense", "status": "received"}}
+    if _IBM_ORCH_KEY:
+        provided = request.headers.get("X-IBM-ORCH-KEY")
+        # Constant-time compare so the check doesn't leak key bytes via timing
+        if not hmac.compare_digest(provided or "", _IBM_ORCH_KEY):
+            return ORJSONResponse(status_code=401, content={"error": "unauthorized"})
 
-    if action in {"invoice.create", "invoice_create"}:
-        return {"status": "ok", "result": {"invoice_id": "inv_demo_001", "status": "created"}}
+    action = (event.action or "").strip().casefold()
 
-    if action in {"fraud.scan", "fraud_scan"}:
-        return {"status": "ok", "result": {"risk_score": 0.02, "flagged": False}}
+    # Route actions to initialized agents (stubs in DEMO_MODE)
+    handler = _ORCH_ACTIONS.get(action)
+    if handler is None:
+        return ORJSONResponse(status_code=400, content={"error": f"unknown action: {event.action}"})
+    return await handler(event.payload or {}, app)
+
+# Static payloads: the dict literals are built once at import (no per-request
+# BUILD_MAP/BUILD_LIST work) and serialized once; requests are a memcpy plus
+# an ETag comparison
+_ROOT = {
+    "service": "FinAgent Pro",
+    "status": "operational",
+    "version": "1.0.0",
+    "agents": {
+        "expense_classifier": "ready",
+        "invoice_agent": "ready",
+        "fraud_analyzer": "ready",
+        "cashflow_forecast": "ready",
+        "orchestrator": "ready"
+    }
+}
+_ROOT_BYTES = orjson.dumps(_ROOT)
+_ROOT_ETAG = f'"{hashlib.blake2b(_ROOT_BYTES, digest_size=8).hexdigest()}"'
 
-    if action in {"cashflow.forecast", "cashflow_forecast"}:
-        return {"status": "ok", "result": {"forecast_days": 30, "trend": "stable"}}
 
-    if action in {"smart.chat", "smart_chat"}:
-        query = payload.get("query", "Hello")
-        return {"status": "ok", "result": {"reply": f"[DEMO] You asked: {query}"}}
+def _static_json(request: Request, content: bytes, etag: str) -> Response:
+    """Serve a pre-serialized JSON payload with ETag revalidation"""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
 
-    return JSONResponse(status_code=400, content={"error": f"unknown action: {event.action}"})
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint"""
-    return {
-        "service": "FinAgent Pro",
-        "status": "operational",
-        "version": "1.0.0",
-        "agents": {
-            "expense_classifier": "ready",
-            "invoice_agent": "ready",
-            "fraud_analyzer": "ready",
-            "cashflow_forecast": "ready",
-            "orchestrator": "ready"
-        }
-    }
+    return _static_json(request, _ROOT_BYTES, _ROOT_ETAG)
+
+
+async def _probe_agent(name, agent, timeout: float = 1.0):
+    """Run one health probe, tolerating sync or async implementations"""
+    try:
+        result = agent.health_status()
+        if inspect.isawaitable(result):
+            result = await asyncio.wait_for(result, timeout)
+        return name, result
+    except Exception as e:
+        return name, {"status": "unhealthy", "error": str(e)}
 
 
 @app.get("/health")
 async def health_check():
     """Comprehensive health check"""
+    probes = await asyncio.gather(
+        _probe_agent("expense_classifier", app.state.expense_classifier),
+        _probe_agent("invoice_agent", app.state.invoice_agent),
+        _probe_agent("fraud_analyzer", app.state.fraud_analyzer),
+        _probe_agent("cashflow_forecast", app.state.cashflow_forecast),
+    )
+    agents = dict(probes)
+    degraded = any(a.get("status") == "unhealthy" for a in agents.values())
     return {
-        "status": "healthy",
+        "status": "degraded" if degraded else "healthy",
         "database": "connected",
-        "agents": {
-            "expense_classifier": app.state.expense_classifier.health_status(),
-            "invoice_agent": app.state.invoice_agent.health_status(),
-            "fraud_analyzer": app.state.fraud_analyzer.health_status(),
-            "cashflow_forecast": app.state.cashflow_forecast.health_status()
-        }
+        "agents": agents
     }
 
 
@@ -234,24 +384,32 @@ async def upload_expense(
     - Fraud detection
     - Automatic categorization
     """
+    logger.info("Processing expense upload for user {uid}", uid=user.id)
+
+    # Spool the upload to a bounded temp file in chunks so a large
+    # receipt never sits in one giant bytes object on the event loop,
+    # and the orchestrator gets a plain file handle instead of the
+    # framework's UploadFile object
+    spool = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    while chunk := await file.read(1 << 16):
+        spool.write(chunk)
+    spool.seek(0)
+
     try:
-        logger.info(f"Processing expense upload for user {user.id}")
-        
         # Trigger expense processing workflow
         result = await app.state.orchestrator.execute_workflow(
             workflow_type="expense_processing",
             data={
-                "file": file,
-                "user_id": str(user.id),
-                "filename": file.filename
+                "file": spool,
+                "user_id": user.id,
+                "filename": file.filename,
+                "content_type": file.content_type
             }
         )
-        
-        return ExpenseUploadResponse(**result)
-        
-    except Exception as e:
-        logger.error(f"Expense upload failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        spool.close()
+
+    return ExpenseUploadResponse(**result)
 
 
 @app.get("/api/v1/expenses")
@@ -259,36 +417,30 @@ async def list_expenses(
     limit: int = 50,
     offset: int = 0,
     category: Optional[str] = None,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db)
 ):
     """List all expenses with optional filtering"""
-    try:
-        db = DatabaseService()
-        expenses = await db.get_expenses(
-            user_id=user.id,
-            limit=limit,
-            offset=offset,
-            category=category
-        )
-        return {"expenses": expenses, "total": len(expenses)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    expenses, total = await db.get_expenses(
+        user_id=user.id,
+        limit=limit,
+        offset=offset,
+        category=category
+    )
+    return {"expenses": expenses, "total": total}
 
 
 @app.get("/api/v1/expenses/{expense_id}")
 async def get_expense(
     expense_id: str,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db)
 ):
     """Get detailed expense information"""
-    try:
-        db = DatabaseService()
-        expense = await db.get_expense_by_id(expense_id, user.id)
-        if not expense:
-            raise HTTPException(status_code=404, detail="Expense not found")
-        return expense
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    expense = await db.get_expense_by_id(expense_id, user.id)
+    if not expense:
+        raise HTTPException(status_code=404, detail="Expense not found")
+    return expense
 
 
 @app.get("/api/v1/expenses/{expense_id}/receipt")
@@ -300,24 +452,20 @@ async def get_expense_receipt(
     from fastapi.responses import Response
     import base64
     
-    try:
-        if DEMO_MODE:
-            receipt_data = app.state.expense_classifier.get_receipt(expense_id)
-            if not receipt_data:
-                raise HTTPException(status_code=404, detail="Receipt not found")
-            
-            file_bytes = base64.b64decode(receipt_data["file_content"])
-            return Response(
-                content=file_bytes,
-                media_type=receipt_data.get("content_type", "image/jpeg"),
-                headers={"Content-Disposition": f"inline; filename={receipt_data.get('filename', 'receipt.jpg')}"}
-            )
-        else:
-            # In production: fetch from storage service
-            raise HTTPException(status_code=501, detail="Not implemented in production mode")
-    except Exception as e:
-        logger.error(f"Failed to get receipt: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if DEMO_MODE:
+        receipt_data = app.state.expense_classifier.get_receipt(expense_id)
+        if not receipt_data:
+            raise HTTPException(status_code=404, detail="Receipt not found")
+
+        file_bytes = base64.b64decode(receipt_data["file_content"])
+        return Response(
+            content=file_bytes,
+            media_type=receipt_data.get("content_type", "image/jpeg"),
+            headers={"Content-Disposition": f"inline; filename={receipt_data.get('filename', 'receipt.jpg')}"}
+        )
+    else:
+        # In production: fetch from storage service
+        raise HTTPException(status_code=501, detail="Not implemented in production mode")
 
 
 # ==================== Invoice Management ====================
@@ -334,23 +482,18 @@ async def create_invoice(
     - Payment link creation
     - Automatic delivery
     """
-    try:
-        logger.info(f"Creating invoice for user {user.id}")
-        
-        # Trigger invoice creation workflow
-        result = await app.state.orchestrator.execute_workflow(
-            workflow_type="invoice_creation",
-            data={
-                "input": request.dict(),
-                "user_id": str(user.id)
-            }
-        )
-        
-        return InvoiceResponse(**result)
-        
-    except Exception as e:
-        logger.error(f"Invoice creation failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Creating invoice for user {uid}", uid=user.id)
+
+    # Trigger invoice creation workflow
+    result = await app.state.orchestrator.execute_workflow(
+        workflow_type="invoice_creation",
+        data={
+            "input": request.model_dump(exclude_unset=True),
+            "user_id": user.id
+        }
+    )
+
+    return InvoiceResponse(**result)
 
 
 @app.get("/api/v1/invoices")
@@ -358,20 +501,17 @@ async def list_invoices(
     limit: int = 50,
     offset: int = 0,
     status: Optional[str] = None,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db)
 ):
     """List all invoices"""
-    try:
-        db = DatabaseService()
-        invoices = await db.get_invoices(
-            user_id=user.id,
-            limit=limit,
-            offset=offset,
-            status=status
-        )
-        return {"invoices": invoices, "total": len(invoices)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    invoices, total = await db.get_invoices(
+        user_id=user.id,
+        limit=limit,
+        offset=offset,
+        status=status
+    )
+    return {"invoices": invoices, "total": total}
 
 
 @app.get("/api/v1/invoices/{invoice_id}/pdf")
@@ -383,24 +523,20 @@ async def download_invoice_pdf(
     from fastapi.responses import Response
     import base64
     
-    try:
-        if DEMO_MODE:
-            pdf_data = app.state.invoice_agent.get_invoice_pdf(invoice_id)
-            if not pdf_data:
-                raise HTTPException(status_code=404, detail="Invoice PDF not found")
-            
-            pdf_bytes = base64.b64decode(pdf_data)
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={"Content-Disposition": f"attachment; filename=invoice_{invoice_id}.pdf"}
-            )
-        else:
-            # In production: fetch from storage service
-            raise HTTPException(status_code=501, detail="Not implemented in production mode")
-    except Exception as e:
-        logger.error(f"Failed to download invoice PDF: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if DEMO_MODE:
+        pdf_data = app.state.invoice_agent.get_invoice_pdf(invoice_id)
+        if not pdf_data:
+            raise HTTPException(status_code=404, detail="Invoice PDF not found")
+
+        pdf_bytes = base64.b64decode(pdf_data)
+        return Response(
+            content=pdf_bytes,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f"attachment; filename=invoice_{invoice_id}.pdf"}
+        )
+    else:
+        # In production: fetch from storage service
+        raise HTTPException(status_code=501, detail="Not implemented in production mode")
 
 
 # ==================== Analytics ====================
@@ -415,13 +551,8 @@ async def get_expense_analytics(user: User = Depends(get_current_user)):
     - Monthly trends
     - Top merchants
     """
-    try:
-        logger.info(f"Fetching expense analytics for user {user.id}")
-        analytics = app.state.expense_classifier.get_analytics(str(user.id))
-        return analytics
-    except Exception as e:
-        logger.error(f"Failed to fetch expense analytics: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Fetching expense analytics for user {uid}", uid=user.id)
+    return app.state.expense_classifier.get_analytics(user.id)
 
 
 # ==================== Invoice Tracking ====================
@@ -437,13 +568,8 @@ async def get_invoices(
     - Track invoice history
     - Monitor payment status
     """
-    try:
-        logger.info(f"Fetching invoices for user {user.id}, status filter: {status}")
-        invoices = app.state.invoice_agent.get_invoices(str(user.id), status)
-        return invoices
-    except Exception as e:
-        logger.error(f"Failed to fetch invoices: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Fetching invoices for user {uid}, status filter: {status}", uid=user.id, status=status)
+    return app.state.invoice_agent.get_invoices(user.id, status)
 
 
 @app.put("/api/v1/invoices/{invoice_id}/status")
@@ -457,17 +583,11 @@ async def update_invoice_status(
     - Mark as paid, pending, or overdue
     - Track payment history
     """
-    try:
-        logger.info(f"Updating invoice {invoice_id} status to {payment_status}")
-        success = app.state.invoice_agent.update_invoice_status(invoice_id, payment_status)
-        if not success:
-            raise HTTPException(status_code=404, detail="Invoice not found")
-        return {"success": True, "invoice_id": invoice_id, "payment_status": payment_status}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to update invoice status: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Updating invoice {inv} status to {status}", inv=invoice_id, status=payment_status)
+    success = app.state.invoice_agent.update_invoice_status(invoice_id, payment_status)
+    if not success:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    return {"success": True, "invoice_id": invoice_id, "payment_status": payment_status}
 
 
 @app.put("/api/v1/invoices/{invoice_id}/send")
@@ -476,11 +596,8 @@ async def send_invoice(
     user: User = Depends(get_current_user)
 ):
     """Send invoice to client via email"""
-    try:
-        result = await app.state.invoice_agent.send_invoice(invoice_id)
-        return {"status": "sent", "invoice_id": invoice_id, "result": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await app.state.invoice_agent.send_invoice(invoice_id)
+    return {"status": "sent", "invoice_id": invoice_id, "result": result}
 
 
 # ==================== Fraud Detection ====================
@@ -489,19 +606,15 @@ async def send_invoice(
 async def get_fraud_alerts(
     limit: int = 50,
     severity: Optional[str] = None,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db)
 ):
     """Get fraud alerts"""
-    try:
-        db = DatabaseService()
-        alerts = await db.get_fraud_alerts(
-            user_id=user.id,
-            limit=limit,
-            severity=severity
-        )
-        return alerts
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await db.get_fraud_alerts(
+        user_id=user.id,
+        limit=limit,
+        severity=severity
+    )
 
 
 @app.post("/api/v1/fraud/analyze/{transaction_id}")
@@ -510,29 +623,22 @@ async def analyze_transaction(
     user: User = Depends(get_current_user)
 ):
     """Manually trigger fraud analysis on a transaction"""
-    try:
-        result = await app.state.fraud_analyzer.analyze_transaction(
-            transaction_id=transaction_id,
-            user_id=str(user.id)
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.fraud_analyzer.analyze_transaction(
+        transaction_id=transaction_id,
+        user_id=user.id
+    )
 
 
 @app.put("/api/v1/fraud/alerts/{alert_id}/resolve")
 async def resolve_fraud_alert(
     alert_id: str,
     action: str,  # approve, reject, investigate
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db)
 ):
     """Resolve a fraud alert"""
-    try:
-        db = DatabaseService()
-        result = await db.resolve_fraud_alert(alert_id, action, user.id)
-        return {"status": "resolved", "action": action, "alert_id": alert_id}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    await db.resolve_fraud_alert(alert_id, action, user.id)
+    return {"status": "resolved", "action": action, "alert_id": alert_id}
 
 
 # ==================== Cashflow Forecasting ====================
@@ -542,13 +648,18 @@ async def get_cashflow_forecast(
     user: User = Depends(get_current_user)
 ):
     """Get latest cashflow forecast"""
-    try:
-        forecast = await app.state.cashflow_forecast.get_latest_forecast(
-            user_id=str(user.id)
-        )
-        return forecast
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    forecast = await app.state.cashflow_forecast.get_latest_forecast(
+        user_id=user.id
+    )
+    # Forecast payloads carry thousands of floats across the series and
+    # scenarios; serializing once with orjson and returning raw bytes skips
+    # jsonable_encoder's per-float iteration (response_model stays for docs)
+    if isinstance(forecast, BaseModel):
+        forecast = forecast.model_dump()
+    return Response(
+        content=orjson.dumps(forecast, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json"
+    )
 
 
 @app.post("/api/v1/forecast/refresh")
@@ -556,14 +667,11 @@ async def refresh_forecast(
     user: User = Depends(get_current_user)
 ):
     """Manually trigger forecast regeneration"""
-    try:
-        result = await app.state.orchestrator.execute_workflow(
-            workflow_type="cashflow_forecast",
-            data={"user_id": str(user.id)}
-        )
-        return {"status": "refreshed", "forecast": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await app.state.orchestrator.execute_workflow(
+        workflow_type="cashflow_forecast",
+        data={"user_id": user.id}
+    )
+    return {"status": "refreshed", "forecast": result}
 
 
 @app.get("/api/v1/forecast/scenarios")
@@ -571,13 +679,9 @@ async def get_forecast_scenarios(
     user: User = Depends(get_current_user)
 ):
     """Get cashflow scenarios (best, expected, worst case)"""
-    try:
-        scenarios = await app.state.cashflow_forecast.generate_scenarios(
-            user_id=str(user.id)
-        )
-        return scenarios
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.cashflow_forecast.generate_scenarios(
+        user_id=user.id
+    )
 
 
 # ==================== Workflow Orchestration ====================
@@ -588,14 +692,10 @@ async def trigger_workflow(
     user: User = Depends(get_current_user)
 ):
     """Trigger a custom workflow"""
-    try:
-        result = await app.state.orchestrator.execute_workflow(
-            workflow_type=request.workflow_type,
-            data={**request.data, "user_id": str(user.id)}
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.orchestrator.execute_workflow(
+        workflow_type=request.workflow_type,
+        data={**request.data, "user_id": user.id}
+    )
 
 
 @app.get("/api/v1/orchestrate/status/{workflow_id}", response_model=WorkflowStatus)
@@ -604,219 +704,174 @@ async def get_workflow_status(
     user: User = Depends(get_current_user)
 ):
     """Check workflow execution status"""
-    try:
-        status = await app.state.orchestrator.get_workflow_status(workflow_id)
-        return status
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.orchestrator.get_workflow_status(workflow_id)
 
 
 @app.get("/api/v1/agents/health")
 async def agent_health_check():
     """Check health status of all agents"""
-    return {
-        "expense_classifier": app.state.expense_classifier.health_status(),
-        "invoice_agent": app.state.invoice_agent.health_status(),
-        "fraud_analyzer": app.state.fraud_analyzer.health_status(),
-        "cashflow_forecast": app.state.cashflow_forecast.health_status(),
-        "orchestrator": app.state.orchestrator.health_status(),
-        "huggingface_service": app.state.huggingface.health_status() if hasattr(app.state, 'huggingface') else {"status": "not_initialized"},
-        "smart_assistant": app.state.smart_assistant.health_status() if hasattr(app.state, 'smart_assistant') else {"status": "not_initialized"}
-    }
+    probes = await asyncio.gather(
+        _probe_agent("expense_classifier", app.state.expense_classifier),
+        _probe_agent("invoice_agent", app.state.invoice_agent),
+        _probe_agent("fraud_analyzer", app.state.fraud_analyzer),
+        _probe_agent("cashflow_forecast", app.state.cashflow_forecast),
+        _probe_agent("orchestrator", app.state.orchestrator),
+        # lifespan always sets these attributes; if their initialization
+        # fails the server never starts, so no hasattr guard is needed
+        _probe_agent("huggingface_service", app.state.huggingface),
+        _probe_agent("smart_assistant", app.state.smart_assistant),
+    )
+    return dict(probes)
 
 
 # ==================== NEW: AI-Powered Features ====================
 
 @app.post("/api/v1/ai/chat/query")
-async def conversational_query(request: dict):
+async def conversational_query(request: ChatQueryRequest):
     """
     Natural language financial queries
     Example: "Show me travel expenses over $500 last month"
     """
-    try:
-        query = request.get("query")
-        user_id = request.get("user_id", "demo_user")
-        context = request.get("context", {})
-        
-        # Get expenses (simplified - in production, query from DB)
-        expenses = []  # TODO: Query from database
-        
-        result = await app.state.smart_assistant.natural_language_query(
-            user_query=query,
-            user_id=user_id,
-            expense_data=expenses
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Get expenses (simplified - in production, query from DB)
+    expenses = []  # TODO: Query from database
+
+    return await app.state.smart_assistant.natural_language_query(
+        user_query=request.query,
+        user_id=request.user_id,
+        expense_data=expenses
+    )
 
 
 @app.post("/api/v1/ai/budget/alerts")
-async def predictive_budget_alerts(request: dict):
+async def predictive_budget_alerts(request: BudgetAlertRequest):
     """
     AI predicts budget overages before they happen
     """
-    try:
-        user_id = request.get("user_id", "demo_user")
-        expenses = request.get("expenses", [])
-        budget_limits = request.get("budget_limits", {
-            "Travel": 10000,
-            "Software": 5000,
-            "Marketing": 8000
-        })
-        
-        alerts = await app.state.smart_assistant.predictive_budget_alerts(
-            user_id=user_id,
-            current_expenses=expenses,
-            budget_limits=budget_limits
-        )
-        return {"alerts": alerts}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    alerts = await app.state.smart_assistant.predictive_budget_alerts(
+        user_id=request.user_id,
+        current_expenses=request.expenses,
+        budget_limits=request.budget_limits
+    )
+    return {"alerts": alerts}
 
 
 @app.post("/api/v1/ai/recommendations")
-async def smart_recommendations(request: dict):
+async def smart_recommendations(request: RecommendationsRequest):
     """
     AI-powered cost optimization recommendations
     """
-    try:
-        user_id = request.get("user_id", "demo_user")
-        expenses = request.get("expenses", [])
-        forecast = request.get("forecast_data", {})
-        
-        recommendations = await app.state.smart_assistant.smart_recommendations(
-            user_id=user_id,
-            expense_data=expenses,
-            forecast_data=forecast
-        )
-        return recommendations
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.smart_assistant.smart_recommendations(
+        user_id=request.user_id,
+        expense_data=request.expenses,
+        forecast_data=request.forecast_data
+    )
 
 
 @app.post("/api/v1/ai/tax/optimize")
-async def tax_optimization(request: dict):
+async def tax_optimization(request: TaxOptimizeRequest):
     """
     Automated tax deduction identification
     """
-    try:
-        user_id = request.get("user_id", "demo_user")
-        expenses = request.get("expenses", [])
-        profile = request.get("user_profile", {"business_type": "LLC"})
-        
-        tax_insights = await app.state.smart_assistant.automated_tax_optimization(
-            user_id=user_id,
-            expenses=expenses,
-            user_profile=profile
-        )
-        return tax_insights
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.smart_assistant.automated_tax_optimization(
+        user_id=request.user_id,
+        expenses=request.expenses,
+        user_profile=request.user_profile
+    )
 
 
 @app.post("/api/v1/ai/voice/process")
-async def voice_command(request: dict):
+async def voice_command(request: VoiceCommandRequest):
     """
     Process voice commands for hands-free operation
     Example: "Add lunch receipt for $45 at Chipotle"
     """
-    try:
-        transcript = request.get("transcript")
-        user_id = request.get("user_id", "demo_user")
-        
-        result = await app.state.smart_assistant.voice_command_processing(
-            audio_transcript=transcript,
-            user_id=user_id
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.smart_assistant.voice_command_processing(
+        audio_transcript=request.transcript,
+        user_id=request.user_id
+    )
 
 
 @app.post("/api/v1/ai/team/insights")
-async def team_collaboration_insights(request: dict):
+async def team_collaboration_insights(request: TeamInsightsRequest):
     """
     Real-time team spending insights
     """
-    try:
-        team_id = request.get("team_id", "demo_team")
-        team_expenses = request.get("expenses", [])
-        
-        insights = await app.state.smart_assistant.real_time_collaboration_insights(
-            team_id=team_id,
-            team_expenses=team_expenses
-        )
-        return insights
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return await app.state.smart_assistant.real_time_collaboration_insights(
+        team_id=request.team_id,
+        team_expenses=request.expenses
+    )
+
+
+_FEATURES = {
+    "features": [
+        {
+            "name": "Natural Language Queries",
+            "description": "Ask questions in plain English about your expenses",
+            "endpoint": "/api/v1/ai/chat/query",
+            "example": "Show me all travel expenses over $500 last month"
+        },
+        {
+            "name": "Predictive Budget Alerts",
+            "description": "AI predicts budget overages before they happen",
+            "endpoint": "/api/v1/ai/budget/alerts",
+            "benefit": "Catch overspending 2 weeks early"
+        },
+        {
+            "name": "Smart Recommendations",
+            "description": "AI-powered cost optimization suggestions",
+            "endpoint": "/api/v1/ai/recommendations",
+            "benefit": "Average $12K annual savings"
+        },
+        {
+            "name": "Tax Optimization",
+            "description": "Automated tax deduction identification",
+            "endpoint": "/api/v1/ai/tax/optimize",
+            "benefit": "Maximize deductions automatically"
+        },
+        {
+            "name": "Voice Commands",
+            "description": "Hands-free expense management",
+            "endpoint": "/api/v1/ai/voice/process",
+            "example": "Add lunch receipt for $45"
+        },
+        {
+            "name": "Team Insights",
+            "description": "Real-time collaboration analytics",
+            "endpoint": "/api/v1/ai/team/insights",
+            "benefit": "Identify team spending patterns"
+        },
+        {
+            "name": "Receipt Enhancement",
+            "description": "AI fills missing receipt data",
+            "endpoint": "/api/v1/expenses/upload",
+            "benefit": "95% auto-completion accuracy"
+        }
+    ],
+    "models": {
+        "financial_sentiment": "ProsusAI/finbert",
+        "document_understanding": "microsoft/layoutlmv3-base",
+        "conversational": "HuggingFaceH4/zephyr-7b-beta",
+        "summarization": "facebook/bart-large-cnn"
+    },
+    "competitive_advantages": [
+        "FinBERT financial domain expertise (vs general GPT)",
+        "Multi-modal document processing (text + images)",
+        "Voice-first interface for mobile users",
+        "Predictive alerts (not just reactive)",
+        "Team collaboration features",
+        "Automated tax optimization"
+    ]
+}
+_FEATURES_BYTES = orjson.dumps(_FEATURES)
+_FEATURES_ETAG = f'"{hashlib.blake2b(_FEATURES_BYTES, digest_size=8).hexdigest()}"'
 
 
 @app.get("/api/v1/ai/features")
-async def list_ai_features():
+async def list_ai_features(request: Request):
     """
     List all AI-powered competitive features
     """
-    return {
-        "features": [
-            {
-                "name": "Natural Language Queries",
-                "description": "Ask questions in plain English about your expenses",
-                "endpoint": "/api/v1/ai/chat/query",
-                "example": "Show me all travel expenses over $500 last month"
-            },
-            {
-                "name": "Predictive Budget Alerts",
-                "description": "AI predicts budget overages before they happen",
-                "endpoint": "/api/v1/ai/budget/alerts",
-                "benefit": "Catch overspending 2 weeks early"
-            },
-            {
-                "name": "Smart Recommendations",
-                "description": "AI-powered cost optimization suggestions",
-                "endpoint": "/api/v1/ai/recommendations",
-                "benefit": "Average $12K annual savings"
-            },
-            {
-                "name": "Tax Optimization",
-                "description": "Automated tax deduction identification",
-                "endpoint": "/api/v1/ai/tax/optimize",
-                "benefit": "Maximize deductions automatically"
-            },
-            {
-                "name": "Voice Commands",
-                "description": "Hands-free expense management",
-                "endpoint": "/api/v1/ai/voice/process",
-                "example": "Add lunch receipt for $45"
-            },
-            {
-                "name": "Team Insights",
-                "description": "Real-time collaboration analytics",
-                "endpoint": "/api/v1/ai/team/insights",
-                "benefit": "Identify team spending patterns"
-            },
-            {
-                "name": "Receipt Enhancement",
-                "description": "AI fills missing receipt data",
-                "endpoint": "/api/v1/expenses/upload",
-                "benefit": "95% auto-completion accuracy"
-            }
-        ],
-        "models": {
-            "financial_sentiment": "ProsusAI/finbert",
-            "document_understanding": "microsoft/layoutlmv3-base",
-            "conversational": "HuggingFaceH4/zephyr-7b-beta",
-            "summarization": "facebook/bart-large-cnn"
-        },
-        "competitive_advantages": [
-            "FinBERT financial domain expertise (vs general GPT)",
-            "Multi-modal document processing (text + images)",
-            "Voice-first interface for mobile users",
-            "Predictive alerts (not just reactive)",
-            "Team collaboration features",
-            "Automated tax optimization"
-        ]
-    }
+    return _static_json(request, _FEATURES_BYTES, _FEATURES_ETAG)
 
 
 # ==================== Demo Invoice Endpoint ====================
@@ -828,7 +883,7 @@ async def create_demo_invoice(request: dict):
     For testing and demonstration purposes
     """
     try:
-        logger.info(f"Creating demo invoice: {request}")
+        logger.info("Creating demo invoice: {req}", req=request)
         
         # Extract invoice details from request
         description = request.get("description", "")
@@ -858,7 +913,7 @@ async def create_demo_invoice(request: dict):
             }
         }
     except Exception as e:
-        logger.error(f"Demo invoice creation failed: {str(e)}")
+        logger.error("Demo invoice creation failed: {err}", err=str(e))
         return {
             "success": False,
             "error": str(e)
@@ -870,29 +925,45 @@ async def create_demo_invoice(request: dict):
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+async def _forward_events(websocket: WebSocket, queue: asyncio.Queue):
+    """Push broadcast events from the subscriber queue to one client"""
+    while True:
+        data = await queue.get()
+        await websocket.send_bytes(data)
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time notifications"""
     await websocket.accept()
+    queue = app.state.events.subscribe()
+    forwarder = asyncio.create_task(_forward_events(websocket, queue))
     try:
+        await websocket.send_json({"type": "connection", "status": "active"})
         while True:
-            data = await websocket.receive_text()
-            # Handle real-time events
-            await websocket.send_json({
-                "type": "connection",
-                "status": "active"
-            })
+            # Client messages only keep the connection alive; events are
+            # pushed by the forwarder task from the broadcaster
+            await websocket.receive_text()
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
+    finally:
+        forwarder.cancel()
+        app.state.events.unsubscribe(queue)
 
 
 # ==================== Run Application ====================
 
 if __name__ == "__main__":
+    # Single-process dev server. In production run multi-process instead:
+    #   gunicorn main:app -c gunicorn_conf.py
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=os.getenv("DEV_RELOAD", "1").lower() in {"1", "true", "yes"},
+        # uvicorn[standard] ships uvloop (C event loop) and httptools (C HTTP
+        # parser); pin them explicitly instead of relying on "auto" detection
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
         log_level="info"
     )
@@ -2,17 +2,46 @@
 Pydantic models for request/response schemas
 """
 
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Dict, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import datetime, date
 from enum import Enum
+from functools import lru_cache
+import re
+
+# Cheap structural email check: User is built on every authenticated
+# request, and pulling in email_validator (what EmailStr runs) costs an
+# import plus a pure-Python parse per construction; full RFC validation
+# belongs on registration input, not internal representations
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _validate_email(v: str) -> str:
+    if not _EMAIL_RE.match(v):
+        raise ValueError("invalid email address")
+    return v
+
+
+Email = Annotated[str, AfterValidator(_validate_email)]
+
+
+@lru_cache(maxsize=32)
+def list_adapter(cls) -> TypeAdapter:
+    """
+    Cached TypeAdapter(list[cls]) for bulk list-of-model validation
+    Building a TypeAdapter compiles a pydantic-core validator, which is two
+    orders of magnitude more expensive than reusing one; callers validating
+    untrusted row lists should go through this instead of per-item
+    model_validate
+    """
+    return TypeAdapter(list[cls])
 
 
 # ==================== User Models ====================
 
 class User(BaseModel):
     id: str
-    email: EmailStr
+    email: Email
     full_name: str
     company: Optional[str] = None
     role: str = "user"
@@ -37,12 +66,14 @@ class ExpenseCategory(str, Enum):
 
 
 class LineItem(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     item: str
     quantity: int = 1
     price: float
 
 
 class ExpenseUploadResponse(BaseModel):
+    """Safe to build via model_construct from DB rows (types enforced by schema)"""
     expense_id: str
     user_id: str
     amount: Optional[float]
@@ -67,6 +98,7 @@ class ExpenseUploadResponse(BaseModel):
 # ==================== Invoice Models ====================
 
 class InvoiceItem(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     description: str
     quantity: int = 1
     unit_price: float
@@ -80,6 +112,7 @@ class InvoiceRequest(BaseModel):
 
 
 class InvoiceResponse(BaseModel):
+    """Safe to build via model_construct from DB rows (types enforced by schema)"""
     invoice_id: str
     invoice_number: str
     client_name: str
@@ -108,7 +141,14 @@ class FraudSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+# Precomputed once at import so the severity validator does a dict hit
+# instead of the generic enum-coercion machinery per call
+_FRAUD_SEVERITY_BY_VALUE = {s.value: s for s in FraudSeverity}
+
+
 class FraudAlert(BaseModel):
+    """Validated on construction; DB rows go through list_adapter(FraudAlert)"""
+    model_config = ConfigDict(frozen=True)
     transaction_id: str
     analysis_id: str
     risk_score: float
@@ -125,10 +165,22 @@ class FraudAlert(BaseModel):
     analyzed_at: str
     alert_id: Optional[str] = None
 
+    @field_validator("severity", mode="before")
+    @classmethod
+    def _coerce_severity(cls, v):
+        # Fast path: resolve known string values through a precomputed
+        # table instead of the generic enum-coercion machinery
+        if isinstance(v, str):
+            member = _FRAUD_SEVERITY_BY_VALUE.get(v)
+            if member is not None:
+                return member
+        return v
+
 
 # ==================== Cashflow Models ====================
 
 class ForecastData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     dates: List[str]
     predicted: List[float]
     lower_bound: List[float]
@@ -136,6 +188,7 @@ class ForecastData(BaseModel):
 
 
 class NetForecastData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     dates: List[str]
     net_predicted: List[float]
     net_lower: List[float]
@@ -144,12 +197,14 @@ class NetForecastData(BaseModel):
 
 
 class ScenarioData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     daily_net: List[float]
     cumulative: List[float]
     description: str
 
 
 class CashflowMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     runway_months: float
     average_burn_rate: float
     break_even_date: Optional[str]
@@ -194,7 +249,7 @@ class WorkflowStatus(BaseModel):
 
 # ==================== Database Models ====================
 
-from sqlalchemy import Column, String, Float, DateTime, JSON, Integer, Boolean, ForeignKey
+from sqlalchemy import Column, String, Float, DateTime, JSON, Integer, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -215,6 +270,12 @@ class DBUser(Base):
 
 class DBExpense(Base):
     __tablename__ = "expenses"
+    # Composite indexes match the list-query filters exactly, so pages are
+    # an index seek instead of a per-user heap scan
+    __table_args__ = (
+        Index("ix_expense_user_category", "user_id", "category"),
+        Index("ix_expense_user_processed", "user_id", "processed_at"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     expense_id = Column(String, unique=True, nullable=False)
@@ -241,6 +302,9 @@ class DBExpense(Base):
 
 class DBInvoice(Base):
     __tablename__ = "invoices"
+    __table_args__ = (
+        Index("ix_invoice_user_status", "user_id", "status"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     invoice_id = Column(String, unique=True, nullable=False)
@@ -266,16 +330,35 @@ class DBInvoice(Base):
 
 class DBFraudAlert(Base):
     __tablename__ = "fraud_alerts"
+    # Composite indexes match the alerts query: filtered by user_id (and
+    # optionally severity), ordered by detected_at desc
+    __table_args__ = (
+        Index("ix_fraud_user_detected", "user_id", "detected_at"),
+        Index(
+            "ix_fraud_user_severity_detected",
+            "user_id",
+            "severity",
+            "detected_at",
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     alert_id = Column(String, unique=True, nullable=False)
     transaction_id = Column(String, nullable=False)
+    analysis_id = Column(String)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     risk_score = Column(Float, nullable=False)
     severity = Column(String, nullable=False)
     alert_type = Column(String)
+    confidence = Column(Float)
+    ml_score = Column(Float)
+    rule_score = Column(Float)
+    contributing_factors = Column(JSON)
     explanation = Column(String)
     recommended_actions = Column(JSON)
+    requires_review = Column(Boolean)
+    auto_block = Column(Boolean)
+    analyzed_at = Column(String)
     status = Column(String, default="open")
     detected_at = Column(DateTime, default=datetime.utcnow)
     resolved_at = Column(DateTime)
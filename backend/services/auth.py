@@ -6,12 +6,48 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from models.schemas import User
 from typing import Dict, Optional
+from datetime import datetime, timezone
 import os
 
 
+try:
+    import jwt
+    from jwt import PyJWKClient
+    PYJWT_AVAILABLE = True
+except ImportError:
+    PYJWT_AVAILABLE = False
+
+
 security = HTTPBearer(auto_error=False)
 DEMO_MODE = os.getenv("DEMO_MODE", "0").lower() in {"1", "true", "yes"}
 
+JWKS_URL = os.getenv("JWKS_URL")
+JWT_AUDIENCE = os.getenv("JWT_AUDIENCE")
+
+# One JWKS client for the process: PyJWKClient caches the fetched signing
+# keys (refreshed hourly), so verification is a local RSA check instead of
+# a JWKS fetch + key parse per request
+_jwks_client = None
+
+
+def _get_jwks_client() -> "PyJWKClient":
+    global _jwks_client
+    if _jwks_client is None:
+        _jwks_client = PyJWKClient(JWKS_URL, cache_keys=True, lifespan=3600)
+    return _jwks_client
+
+# Built once at import: the demo user is identical on every request, so the
+# auth dependency returns this singleton instead of re-validating the same
+# fields per call (model_construct skips pydantic validation entirely)
+_DEMO_USER = User.model_construct(
+    id="demo_user_id",
+    email="demo@example.com",
+    full_name="Demo User",
+    company=None,
+    role="user",
+    created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
+)
+
 
 class AuthService:
     """Authentication and authorization service"""
@@ -19,7 +55,20 @@ class AuthService:
     @staticmethod
     def verify_token(token: str) -> Dict:
         """Verify JWT token"""
-        # In production, implement JWT verification
+        if PYJWT_AVAILABLE and JWKS_URL:
+            signing_key = _get_jwks_client().get_signing_key_from_jwt(token).key
+            payload = jwt.decode(
+                token,
+                signing_key,
+                algorithms=["RS256"],
+                audience=JWT_AUDIENCE,
+                options={"verify_aud": JWT_AUDIENCE is not None}
+            )
+            return {
+                "user_id": payload.get("sub"),
+                "email": payload.get("email")
+            }
+        # No JWKS endpoint configured: keep the stub payload
         return {
             "user_id": "demo_user_id",
             "email": "user@example.com"
@@ -35,13 +84,7 @@ async def get_current_user(
     """
     # In DEMO_MODE, allow access without authentication
     if DEMO_MODE:
-        return User(
-            id="demo_user_id",
-            email="demo@example.com",
-            full_name="Demo User",
-            role="user",
-            created_at="2025-01-01T00:00:00Z"
-        )
+        return _DEMO_USER
     
     # Production mode requires authentication
     if not credentials:
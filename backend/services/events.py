@@ -0,0 +1,46 @@
+"""
+In-process event broadcaster for real-time WebSocket notifications
+"""
+
+import asyncio
+from typing import Dict, Set
+
+import orjson
+from loguru import logger
+
+
+class EventBroadcaster:
+    """
+    Publish/subscribe fan-out for WebSocket clients
+    - Events are serialized once and the same bytes are sent to every
+      subscriber instead of re-serializing per connection
+    - Slow consumers drop events once their queue is full (bounded
+      backpressure) rather than stalling the publisher
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self._queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a new subscriber and return its event queue"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a subscriber"""
+        self._subscribers.discard(queue)
+
+    def publish(self, event: Dict):
+        """Serialize an event once and fan it out to all subscribers"""
+        data = orjson.dumps(event)
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                logger.warning("Dropping event for slow WebSocket subscriber")
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
@@ -4,6 +4,8 @@ Provides local and cloud-based LLM capabilities for financial AI
 """
 
 import os
+import hashlib
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union
 from loguru import logger
 import asyncio
@@ -17,10 +19,89 @@ except ImportError:
     logger.warning("transformers not installed - using API-only mode")
 
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    REQUESTS_AVAILABLE = False
+    HTTPX_AVAILABLE = False
+    logger.warning("httpx not installed - LLM calls will use simulated responses")
+
+
+# Prompt templates bound once at import; methods only pay for the final
+# format() binding instead of rebuilding multi-KB literals per call
+_RECEIPT_TMPL = """Analyze this receipt and extract structured information:
+
+Receipt Text:
+{receipt_text}
+
+Extract:
+1. Merchant name and type
+2. Total amount and currency
+3. Date and time
+4. Payment method
+5. Line items with prices
+6. Any unusual patterns or anomalies
+7. Suggested expense category
+8. Tax and tip amounts
+
+Provide a JSON response."""
+
+_QUERY_TMPL = """You are a financial AI assistant for FinAgent Pro. 
+Answer the user's question accurately and concisely.
+
+User Question: {user_query}
+{context_str}
+
+Answer:"""
+
+_INSIGHTS_TMPL = """Based on this financial data, provide actionable insights:
+
+{summary}
+
+Generate:
+1. Top 3 spending patterns
+2. Budget optimization recommendations
+3. Risk alerts
+4. Cashflow improvement suggestions
+5. Tax optimization opportunities
+
+Format as JSON with these keys: patterns, budget_tips, risks, cashflow_tips, tax_tips"""
+
+_CATEGORIZATION_TMPL = """Categorize this expense and explain your reasoning:
+
+Merchant: {merchant}
+Description: {description}
+Amount: ${amount}
+
+Categories: Travel, Meals, Office Supplies, Equipment, Software, Marketing, Professional Services, Utilities, Rent, Insurance, Training, Other
+
+Response format:
+{{"category": "...", "subcategory": "...", "confidence": 0-1, "reasoning": "..."}}"""
+
+_INVOICE_TMPL = """Extract invoice details from this conversation:
+
+{conversation}
+
+Extract and format as JSON:
+{{
+  "client_name": "...",
+  "client_email": "...",
+  "items": [
+    {{"description": "...", "quantity": 1, "unit_price": 0}}
+  ],
+  "due_date": "...",
+  "payment_terms": "...",
+  "notes": "..."
+}}
+
+If information is missing, set field to null."""
+
+_NARRATIVE_TMPL = """Generate a concise executive summary of this cashflow forecast:
+
+Expected runway: {runway_months} months
+Monthly burn: ${burn_rate}
+12-month net: ${net_cashflow}
+
+Write 2-3 sentences highlighting key insights and recommendations."""
 
 
 class HuggingFaceService:
@@ -47,25 +128,108 @@ class HuggingFaceService:
             "embeddings": "sentence-transformers/all-MiniLM-L6-v2"  # Semantic search
         }
         
-        # Initialize local models if requested
+        # Content-addressed LLM response cache: identical prompts (common
+        # for categorization of repeat merchants) skip the API round trip
+        self._llm_cache: OrderedDict = OrderedDict()
+        self._llm_cache_max = 10_000
+
+        # Local pipelines are populated by warmup() so model loading never
+        # blocks construction (and therefore app startup)
         self.local_pipelines = {}
-        if use_local_models and TRANSFORMERS_AVAILABLE:
-            self._init_local_models()
-        
+
+        # One shared async client: keep-alive + HTTP/2 multiplexing means
+        # concurrent LLM calls reuse warm TLS connections instead of paying
+        # a handshake per request. http2=True raises if the h2 extra is
+        # missing, so only ask for it when the package is importable and
+        # degrade to HTTP/1.1 keep-alive otherwise
+        self._client = None
+        if HTTPX_AVAILABLE:
+            from importlib.util import find_spec
+            self._client = httpx.AsyncClient(
+                base_url=self.api_base,
+                http2=find_spec("h2") is not None,
+                timeout=30,
+                headers=(
+                    {"Authorization": f"Bearer {self.hf_api_token}"}
+                    if self.hf_api_token else {}
+                ),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+
         logger.info(f"✅ HuggingFaceService initialized (local={use_local_models})")
+
+    async def aclose(self):
+        """Release the shared HTTP client (called at app shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def warmup(self):
+        """
+        Load local models in a worker thread off the startup path
+        Scheduled as a background task at app startup so the first request
+        does not pay the model cold-start cost
+        """
+        if self.use_local_models and TRANSFORMERS_AVAILABLE and not self.local_pipelines:
+            await asyncio.to_thread(self._init_local_models)
     
     def _init_local_models(self):
         """Initialize local models (optional, for offline use)"""
         try:
-            # Lightweight models for demo
-            self.local_pipelines["sentiment"] = pipeline(
-                "sentiment-analysis",
-                model="ProsusAI/finbert",
-                device=0 if torch.cuda.is_available() else -1
-            )
+            # Leave hyperthread siblings to the event loop; enable TF32
+            # matmuls when an Ampere+ GPU is present
+            torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+            if torch.cuda.is_available():
+                torch.backends.cuda.matmul.allow_tf32 = True
+            # Prefer an int8-quantized ONNX export: ~half the memory
+            # bandwidth and roughly double the throughput on VNNI CPUs
+            self.local_pipelines["sentiment"] = self._load_quantized_sentiment()
+            if self.local_pipelines["sentiment"] is None:
+                # Fall back to the plain FP32 transformers pipeline
+                self.local_pipelines["sentiment"] = pipeline(
+                    "sentiment-analysis",
+                    model="ProsusAI/finbert",
+                    device=0 if torch.cuda.is_available() else -1
+                )
+            model = getattr(self.local_pipelines["sentiment"], "model", None)
+            if model is not None and hasattr(model, "eval"):
+                model.eval()
             logger.info("Local sentiment model loaded")
         except Exception as e:
             logger.warning(f"Could not load local models: {e}")
+
+    def _load_quantized_sentiment(self):
+        """
+        Build a sentiment pipeline backed by an int8 ONNX FinBERT
+        Returns None when optimum/onnxruntime is not installed so callers
+        fall back to the FP32 pipeline
+        """
+        try:
+            from optimum.onnxruntime import (
+                ORTModelForSequenceClassification,
+                ORTQuantizer,
+            )
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            import tempfile as _tempfile
+        except ImportError:
+            logger.info("optimum[onnxruntime] not installed - using FP32 pipeline")
+            return None
+        try:
+            model = ORTModelForSequenceClassification.from_pretrained(
+                "ProsusAI/finbert", export=True, provider="CPUExecutionProvider"
+            )
+            quantizer = ORTQuantizer.from_pretrained(model)
+            save_dir = _tempfile.mkdtemp(prefix="finbert-int8-")
+            quantizer.quantize(
+                save_dir=save_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+            )
+            quantized = ORTModelForSequenceClassification.from_pretrained(save_dir)
+            tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
+            logger.info("Loaded int8 ONNX FinBERT for sentiment")
+            return pipeline("sentiment-analysis", model=quantized, tokenizer=tokenizer)
+        except Exception as e:
+            logger.warning(f"ONNX quantization failed, using FP32 pipeline: {e}")
+            return None
     
     async def analyze_receipt_with_llm(
         self,
@@ -78,22 +242,7 @@ class HuggingFaceService:
         - Identify unusual patterns
         - Suggest categorization
         """
-        prompt = f"""Analyze this receipt and extract structured information:
-
-Receipt Text:
-{receipt_text}
-
-Extract:
-1. Merchant name and type
-2. Total amount and currency
-3. Date and time
-4. Payment method
-5. Line items with prices
-6. Any unusual patterns or anomalies
-7. Suggested expense category
-8. Tax and tip amounts
-
-Provide a JSON response."""
+        prompt = _RECEIPT_TMPL.format(receipt_text=receipt_text)
 
         response = await self._call_llm(
             prompt=prompt,
@@ -123,13 +272,7 @@ Provide a JSON response."""
         if context:
             context_str = f"\nContext: {context}"
         
-        prompt = f"""You are a financial AI assistant for FinAgent Pro. 
-Answer the user's question accurately and concisely.
-
-User Question: {user_query}
-{context_str}
-
-Answer:"""
+        prompt = _QUERY_TMPL.format(user_query=user_query, context_str=context_str)
 
         response = await self._call_llm(
             prompt=prompt,
@@ -153,18 +296,7 @@ Answer:"""
         """
         summary = self._summarize_data(expense_data, forecast_data)
         
-        prompt = f"""Based on this financial data, provide actionable insights:
-
-{summary}
-
-Generate:
-1. Top 3 spending patterns
-2. Budget optimization recommendations
-3. Risk alerts
-4. Cashflow improvement suggestions
-5. Tax optimization opportunities
-
-Format as JSON with these keys: patterns, budget_tips, risks, cashflow_tips, tax_tips"""
+        prompt = _INSIGHTS_TMPL.format(summary=summary)
 
         response = await self._call_llm(
             prompt=prompt,
@@ -189,17 +321,47 @@ Format as JSON with these keys: patterns, budget_tips, risks, cashflow_tips, tax
         - Suspicious transaction patterns
         - Social engineering indicators
         """
+        results = await self.detect_sentiment_fraud_signals_batch(
+            [transaction_description]
+        )
+        return results[0]
+
+    async def detect_sentiment_fraud_signals_batch(
+        self,
+        texts: List[str]
+    ) -> List[Dict]:
+        """
+        Batched sentiment fraud scan
+        One API round trip (or one batched local inference) covers the whole
+        list instead of paying per-transaction network/model overhead —
+        fraud-scan loops should call this directly
+        """
+        if not texts:
+            return []
         if self.local_pipelines.get("sentiment"):
-            # Use local model
-            result = self.local_pipelines["sentiment"](transaction_description)
-            return {
-                "sentiment": result[0]["label"],
-                "confidence": result[0]["score"],
-                "fraud_indicator": result[0]["label"] == "negative" and result[0]["score"] > 0.8
-            }
-        else:
-            # Use API
-            return await self._call_sentiment_api(transaction_description)
+            # Use local model; inference is CPU-bound and holds the GIL, so
+            # run it in a worker thread (torch releases the GIL inside ops)
+            # instead of stalling the event loop
+            results = await asyncio.to_thread(self._run_sentiment, texts)
+            return [self._sentiment_result(r) for r in results]
+        # Use API (HF accepts a list of inputs and returns per-item results)
+        return await self._call_sentiment_api_batch(texts)
+
+    def _run_sentiment(self, texts: List[str]):
+        """Run the local pipeline with autograd bookkeeping disabled"""
+        with torch.inference_mode():
+            return self.local_pipelines["sentiment"](texts, batch_size=32)
+
+    @staticmethod
+    def _sentiment_result(result) -> Dict:
+        """Normalize one pipeline/API result item into the fraud-signal dict"""
+        if isinstance(result, list):
+            result = result[0]
+        return {
+            "sentiment": result["label"],
+            "confidence": result["score"],
+            "fraud_indicator": result["label"] == "negative" and result["score"] > 0.8
+        }
     
     async def smart_categorization(
         self,
@@ -210,16 +372,9 @@ Format as JSON with these keys: patterns, budget_tips, risks, cashflow_tips, tax
         """
         AI-powered expense categorization with reasoning
         """
-        prompt = f"""Categorize this expense and explain your reasoning:
-
-Merchant: {merchant}
-Description: {description}
-Amount: ${amount}
-
-Categories: Travel, Meals, Office Supplies, Equipment, Software, Marketing, Professional Services, Utilities, Rent, Insurance, Training, Other
-
-Response format:
-{{"category": "...", "subcategory": "...", "confidence": 0-1, "reasoning": "..."}}"""
+        prompt = _CATEGORIZATION_TMPL.format(
+            merchant=merchant, description=description, amount=amount
+        )
 
         response = await self._call_llm(
             prompt=prompt,
@@ -240,23 +395,7 @@ Response format:
         Extract invoice details from conversational input
         Handles back-and-forth clarifications
         """
-        prompt = f"""Extract invoice details from this conversation:
-
-{chr(10).join(conversation_history)}
-
-Extract and format as JSON:
-{{
-  "client_name": "...",
-  "client_email": "...",
-  "items": [
-    {{"description": "...", "quantity": 1, "unit_price": 0}}
-  ],
-  "due_date": "...",
-  "payment_terms": "...",
-  "notes": "..."
-}}
-
-If information is missing, set field to null."""
+        prompt = _INVOICE_TMPL.format(conversation="\n".join(conversation_history))
 
         response = await self._call_llm(
             prompt=prompt,
@@ -276,13 +415,12 @@ If information is missing, set field to null."""
         """
         Generate human-readable cashflow narrative
         """
-        prompt = f"""Generate a concise executive summary of this cashflow forecast:
-
-Expected runway: {forecast_data.get('metrics', {}).get('runway_months', 12)} months
-Monthly burn: ${forecast_data.get('metrics', {}).get('burn_rate', 25000)}
-12-month net: ${forecast_data.get('metrics', {}).get('net_cashflow', 125000)}
-
-Write 2-3 sentences highlighting key insights and recommendations."""
+        metrics = forecast_data.get('metrics', {})
+        prompt = _NARRATIVE_TMPL.format(
+            runway_months=metrics.get('runway_months', 12),
+            burn_rate=metrics.get('burn_rate', 25000),
+            net_cashflow=metrics.get('net_cashflow', 125000)
+        )
 
         response = await self._call_llm(
             prompt=prompt,
@@ -303,13 +441,20 @@ Write 2-3 sentences highlighting key insights and recommendations."""
         """
         model_name = self.models.get(model_type, self.models["conversational"])
         
-        if not REQUESTS_AVAILABLE or not self.hf_api_token:
+        if self._client is None or not self.hf_api_token:
             # Fallback to simulated response for demo
             logger.warning("HF API not available - returning simulated response")
             return self._simulated_response(prompt)
-        
+
+        key = hashlib.blake2b(
+            f"{model_type}|{max_tokens}|{prompt}".encode(), digest_size=16
+        ).digest()
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+            return cached
+
         try:
-            headers = {"Authorization": f"Bearer {self.hf_api_token}"}
             payload = {
                 "inputs": prompt,
                 "parameters": {
@@ -319,18 +464,16 @@ Write 2-3 sentences highlighting key insights and recommendations."""
                 }
             }
             
-            response = requests.post(
-                f"{self.api_base}/{model_name}",
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            response = await self._client.post(f"/{model_name}", json=payload)
             
             if response.status_code == 200:
                 result = response.json()
                 if isinstance(result, list) and len(result) > 0:
-                    return result[0].get("generated_text", "").replace(prompt, "").strip()
-                return str(result)
+                    text = result[0].get("generated_text", "").replace(prompt, "").strip()
+                else:
+                    text = str(result)
+                self._cache_llm_response(key, text)
+                return text
             else:
                 logger.error(f"HF API error: {response.status_code}")
                 return self._simulated_response(prompt)
@@ -338,29 +481,39 @@ Write 2-3 sentences highlighting key insights and recommendations."""
         except Exception as e:
             logger.error(f"LLM call failed: {str(e)}")
             return self._simulated_response(prompt)
+
+    def _cache_llm_response(self, key: bytes, text: str):
+        """Store a successful response, evicting the oldest entry when full"""
+        self._llm_cache[key] = text
+        self._llm_cache.move_to_end(key)
+        if len(self._llm_cache) > self._llm_cache_max:
+            self._llm_cache.popitem(last=False)
     
     async def _call_sentiment_api(self, text: str) -> Dict:
         """Call sentiment analysis API"""
+        results = await self._call_sentiment_api_batch([text])
+        return results[0]
+
+    async def _call_sentiment_api_batch(self, texts: List[str]) -> List[Dict]:
+        """Call sentiment analysis API with list inputs (one round trip)"""
         try:
-            headers = {"Authorization": f"Bearer {self.hf_api_token}"}
-            response = requests.post(
-                f"{self.api_base}/ProsusAI/finbert",
-                headers=headers,
-                json={"inputs": text},
+            if self._client is None:
+                raise RuntimeError("httpx not available")
+            response = await self._client.post(
+                "/ProsusAI/finbert",
+                json={"inputs": texts},
                 timeout=10
             )
             
             if response.status_code == 200:
-                result = response.json()[0]
-                return {
-                    "sentiment": result["label"],
-                    "confidence": result["score"],
-                    "fraud_indicator": result["label"] == "negative" and result["score"] > 0.8
-                }
-        except:
+                return [self._sentiment_result(r) for r in response.json()]
+        except Exception:
             pass
         
-        return {"sentiment": "neutral", "confidence": 0.5, "fraud_indicator": False}
+        return [
+            {"sentiment": "neutral", "confidence": 0.5, "fraud_indicator": False}
+            for _ in texts
+        ]
     
     def _simulated_response(self, prompt: str) -> str:
         """Generate simulated response for demo mode"""
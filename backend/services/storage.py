@@ -3,25 +3,50 @@ Storage service for file management (S3)
 """
 
 import os
-from typing import BinaryIO
+from typing import AsyncIterable, BinaryIO, Union
 from loguru import logger
 
+try:
+    import aioboto3
+    from boto3.s3.transfer import TransferConfig
+    AIOBOTO3_AVAILABLE = True
+except ImportError:
+    AIOBOTO3_AVAILABLE = False
+
 
 class StorageService:
     """File storage service (S3)"""
     
     def __init__(self):
         self.bucket_name = os.getenv("S3_BUCKET", "finagent-storage")
+        self._session = aioboto3.Session() if AIOBOTO3_AVAILABLE else None
     
     async def upload_file(
         self,
-        file_content: bytes,
+        fileobj: Union[BinaryIO, AsyncIterable[bytes]],
         filename: str,
         folder: str = "receipts"
     ) -> str:
-        """Upload file to S3 and return URL"""
-        # In production, upload to S3
-        url = f"https://storage.finagent.pro/{folder}/{filename}"
+        """
+        Stream a file to S3 and return its URL
+        Accepts a file-like object (e.g. UploadFile.file or a spooled temp
+        file) instead of bytes, so large receipts go up in concurrent
+        multipart chunks at constant memory rather than being buffered whole
+        """
+        key = f"{folder}/{filename}"
+        if self._session is not None:
+            async with self._session.client("s3") as s3:
+                await s3.upload_fileobj(
+                    fileobj,
+                    self.bucket_name,
+                    key,
+                    Config=TransferConfig(
+                        multipart_chunksize=8 * 1024 * 1024,
+                        max_concurrency=8
+                    )
+                )
+        # Without aioboto3 the upload is simulated, as before
+        url = f"https://storage.finagent.pro/{key}"
         logger.info(f"File uploaded: {url}")
         return url
     
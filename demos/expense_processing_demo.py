@@ -0,0 +1,200 @@
+"""
+Demo: OCR-Powered Expense Processing
+Snap a photo of a receipt and watch the agents take it from upload to
+approved expense with fraud screening along the way.
+Run: python demos/expense_processing_demo.py
+"""
+
+import asyncio
+import io
+import os
+import sys
+from functools import lru_cache
+
+API_BASE = os.environ.get("FINAGENT_API", "http://localhost:8000")
+
+
+@lru_cache(maxsize=1)
+def _fallback_date():
+    # The simulated fallback payload is static for a given day; the date
+    # is computed once on first use, and datetime stays un-imported on
+    # the happy path
+    from datetime import datetime
+    return datetime.utcnow().date().isoformat()
+
+# Pacing factor for the narration sleeps; DEMO_SLEEP=0 collapses all
+# pacing so CI/scripted runs finish in milliseconds
+SLEEP = float(os.environ.get("DEMO_SLEEP", "1"))
+
+# Banner rules are constants so repeated narration doesn't reallocate a
+# fresh 60-char string each time
+_BAR = "=" * 60
+_THIN = "-" * 60
+
+# The summary is one preassembled template substituted in a single
+# C-level format_map pass and appended to the buffer as one chunk
+_EXPENSE_SUMMARY = (
+    "\n" + _THIN + "\n📋 SUMMARY\n" + _THIN + "\n"
+    "Expense ID:  {expense_id}\n"
+    "Merchant:    {merchant}\n"
+    "Amount:      ${amount} {currency}\n"
+    "Category:    {category}\n"
+    "Status:      {status}\n"
+    "Confidence:  {confidence}\n"
+    + _BAR + "\n"
+    "✅ Demo complete — receipt to approved expense, no manual entry\n"
+)
+
+# Narration lines are queued and written in one syscall per section:
+# each flush() replaces a burst of per-line print() write+flush pairs
+# with a single sys.stdout.write
+_BUF = []
+
+
+def emit(line=""):
+    _BUF.append(line + "\n")
+
+
+def flush():
+    sys.stdout.write("".join(_BUF))
+    sys.stdout.flush()
+    _BUF.clear()
+
+
+# The client is built on first use so importing this module (pytest
+# collection, verify_setup presence checks) never pays for httpx and its
+# submodule tree; looped demo runs still reuse the warm connection
+_CLIENT = None
+
+
+def _get_client():
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+        _CLIENT = httpx.AsyncClient(
+            base_url=API_BASE,
+            timeout=10.0,
+            headers={"Authorization": "Bearer demo_token"},
+            # A one-request script never needs more than one connection,
+            # and skipping proxy/env discovery shaves construction time
+            limits=httpx.Limits(max_connections=1),
+            trust_env=False
+        )
+    return _CLIENT
+
+
+async def run_expense_processing_demo():
+    emit(_BAR)
+    emit("🧾 FinAgent Pro — Expense Processing Demo")
+    emit(_BAR)
+    emit()
+
+    emit("📸 Step 1: Employee snaps a photo of a flight receipt...")
+    flush()
+    await asyncio.sleep(1 * SLEEP)
+
+    dummy_file = io.BytesIO(
+        b"%PDF-1.4 demo receipt\n"
+        b"UNITED AIRLINES\n"
+        b"SFO -> JFK  Economy\n"
+        b"TOTAL: $842.50\n"
+    )
+
+    emit("📤 Step 2: Uploading receipt to the Expense Classifier Agent...")
+    flush()
+    await asyncio.sleep(1 * SLEEP)
+
+    import httpx
+    import orjson
+
+    try:
+        # Hand httpx the file object itself; the multipart writer chunk-reads
+        # it rather than holding a second full copy of the payload in memory
+        dummy_file.seek(0)
+        response = await _get_client().post(
+            "/api/v1/expenses/upload",
+            files={
+                "file": (
+                    "flight_receipt.pdf",
+                    dummy_file,
+                    "application/pdf"
+                )
+            }
+        )
+        response.raise_for_status()
+        # orjson decodes the payload several times faster than the stdlib
+        # json that response.json() would use
+        expense_data = orjson.loads(response.content)
+        emit("✅ Backend processed the receipt")
+    except httpx.ConnectError:
+        emit("⚠️  Backend not running — showing simulated agent output")
+        expense_data = {
+            "expense_id": "exp_demo_001",
+            "merchant": "United Airlines",
+            "amount": 842.50,
+            "currency": "USD",
+            "date": _fallback_date(),
+            "category": "Travel",
+            "subcategory": "Airfare",
+            "classification_confidence": 0.97,
+            "fraud_analysis": {"risk_score": 12, "severity": "low"},
+            "status": "approved"
+        }
+
+    # Unpack once; the narration and summary below reference each field
+    # several times
+    merchant = expense_data.get("merchant")
+    amount = expense_data.get("amount")
+    currency = expense_data.get("currency", "USD")
+    date = expense_data.get("date")
+    category = expense_data.get("category")
+    subcategory = expense_data.get("subcategory")
+    confidence = expense_data.get("classification_confidence")
+    fraud = expense_data.get("fraud_analysis") or {}
+    status = expense_data.get("status", "pending")
+
+    emit()
+    emit("🔍 Step 3: OCR extraction (Tesseract + LayoutLM)...")
+    flush()
+    await asyncio.sleep(2 * SLEEP)
+    emit(f"   Merchant:   {merchant}")
+    emit(f"   Amount:     ${amount}")
+    emit(f"   Date:       {date}")
+
+    emit()
+    emit("🏷️  Step 4: AI classification (FinBERT)...")
+    flush()
+    await asyncio.sleep(1 * SLEEP)
+    emit(f"   Category:   {category}")
+    emit(f"   Subcategory: {subcategory}")
+    emit(f"   Confidence: {confidence}")
+
+    emit()
+    emit("🛡️  Step 5: Fraud screening...")
+    flush()
+    await asyncio.sleep(2 * SLEEP)
+    emit(f"   Risk score: {fraud.get('risk_score', 0)}/100")
+    emit(f"   Severity:   {fraud.get('severity', 'none')}")
+
+    _BUF.append(_EXPENSE_SUMMARY.format_map({
+        "expense_id": expense_data.get("expense_id"),
+        "merchant": merchant,
+        "amount": amount,
+        "currency": currency,
+        "category": category,
+        "status": status.upper(),
+        "confidence": confidence,
+    }))
+    flush()
+
+
+async def main():
+    try:
+        await run_expense_processing_demo()
+    finally:
+        if _CLIENT is not None:
+            await _CLIENT.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
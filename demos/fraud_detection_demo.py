@@ -0,0 +1,91 @@
+"""
+Demo: Real-time Fraud Detection
+Walks through the Fraud Analyzer Agent catching a suspicious duplicate
+transaction within seconds of submission.
+Run: python demos/fraud_detection_demo.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Pacing factor for the narration sleeps; DEMO_SLEEP=0 collapses all
+# pacing so CI/scripted runs finish in milliseconds
+SLEEP = float(os.environ.get("DEMO_SLEEP", "1"))
+
+# Banner rules are constants so repeated narration doesn't reallocate a
+# fresh 60-char string each time
+_BAR = "=" * 60
+_THIN = "-" * 60
+
+# The summary is entirely static, so it is assembled once at import and
+# appended to the buffer as one chunk
+_FRAUD_SUMMARY = (
+    "\n" + _THIN + "\n📋 SUMMARY\n" + _THIN + "\n"
+    "Transaction:  TechWorld Electronics — $1,847.99\n"
+    "Risk score:   82/100\n"
+    "Severity:     HIGH\n"
+    "Action:       Blocked pending manual review\n"
+    "Detected in:  1.3s from submission\n"
+    + _BAR + "\n"
+    "✅ Demo complete — anomaly caught before the money moved\n"
+)
+
+# Narration lines are queued and written in one syscall per section:
+# each flush() replaces a burst of per-line print() write+flush pairs
+# with a single sys.stdout.write
+_BUF = []
+
+
+def emit(line=""):
+    _BUF.append(line + "\n")
+
+
+def flush():
+    sys.stdout.write("".join(_BUF))
+    sys.stdout.flush()
+    _BUF.clear()
+
+
+async def run_fraud_detection_demo():
+    emit(_BAR)
+    emit("🛡️  FinAgent Pro — Fraud Detection Demo")
+    emit(_BAR)
+    emit()
+
+    emit("💳 Incoming transaction: 'TechWorld Electronics' — $1,847.99")
+    flush()
+    await asyncio.sleep(1 * SLEEP)
+
+    emit()
+    emit("🤖 Step 1: Fraud Analyzer Agent scores the transaction...")
+    flush()
+    await asyncio.sleep(2 * SLEEP)
+    emit("   ML anomaly score (Isolation Forest):  78/100")
+    emit("   Rule engine score:                    65/100")
+
+    emit()
+    emit("🔎 Step 2: Contributing factors identified...")
+    flush()
+    await asyncio.sleep(1 * SLEEP)
+    emit("   • Duplicate of a transaction submitted 4 minutes ago")
+    emit("   • Merchant not seen before for this user")
+    emit("   • Amount 6.2x the user's category average")
+
+    emit()
+    emit("📣 Step 3: Sentiment scan of the merchant descriptor (FinBERT)...")
+    flush()
+    await asyncio.sleep(2 * SLEEP)
+    emit("   Sentiment: negative (0.87) → fraud indicator")
+
+    emit()
+    emit("🚨 Step 4: Alert raised and routed for review...")
+    flush()
+    await asyncio.sleep(1 * SLEEP)
+
+    _BUF.append(_FRAUD_SUMMARY)
+    flush()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_fraud_detection_demo())
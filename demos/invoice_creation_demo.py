@@ -0,0 +1,169 @@
+"""
+Demo: Conversational Invoice Creation
+"Create an invoice for the Acme consulting project" — and the Invoice
+Agent drafts, prices and delivers it.
+Run: python demos/invoice_creation_demo.py
+"""
+
+import os
+import sys
+import time
+from functools import lru_cache
+
+API_BASE = os.environ.get("FINAGENT_API", "http://localhost:8000")
+
+
+@lru_cache(maxsize=1)
+def _fallback_dates():
+    # The simulated fallback payload is static for a given day; the date
+    # fields are computed once on first use, and datetime stays
+    # un-imported on the happy path
+    from datetime import datetime, timedelta
+    today = datetime.utcnow().date()
+    invoice_number = f"INV-{today.strftime('%Y%m%d')}-0045"
+    due_date = (today + timedelta(days=30)).isoformat()
+    return invoice_number, due_date
+
+# Pacing factor for the narration sleeps; DEMO_SLEEP=0 collapses all
+# pacing so CI/scripted runs finish in milliseconds
+SLEEP = float(os.environ.get("DEMO_SLEEP", "1"))
+
+# Banner rules are constants so repeated narration doesn't reallocate a
+# fresh 60-char string each time
+_BAR = "=" * 60
+_THIN = "-" * 60
+
+# The summary is one preassembled template substituted in a single
+# C-level format_map pass and appended to the buffer as one chunk
+_INVOICE_SUMMARY = (
+    "\n" + _THIN + "\n📋 SUMMARY\n" + _THIN + "\n"
+    "Invoice #:   {invoice_number}\n"
+    "Customer:    {customer}\n"
+    "Amount:      ${amount} {currency}\n"
+    "Due date:    {due_date}\n"
+    "Status:      {status}\n"
+    + _BAR + "\n"
+    "✅ Demo complete — one sentence to a delivered invoice\n"
+)
+
+# Narration lines are queued and written in one syscall per section:
+# each flush() replaces a burst of per-line print() write+flush pairs
+# with a single sys.stdout.write
+_BUF = []
+
+
+def emit(line=""):
+    _BUF.append(line + "\n")
+
+
+def flush():
+    sys.stdout.write("".join(_BUF))
+    sys.stdout.flush()
+    _BUF.clear()
+
+
+# The client is built on first use so importing this module (pytest
+# collection, verify_setup presence checks) never pays for httpx and its
+# submodule tree. A sync client is all a one-POST script needs: no event
+# loop, no connector/resolver machinery
+_CLIENT = None
+
+
+def _get_client():
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+        _CLIENT = httpx.Client(
+            base_url=API_BASE,
+            timeout=5.0,
+            headers={"Authorization": "Bearer demo_token"},
+            # A one-request script never needs more than one connection,
+            # and skipping proxy/env discovery shaves construction time
+            limits=httpx.Limits(max_connections=1),
+            trust_env=False
+        )
+    return _CLIENT
+
+
+def pause(seconds):
+    if SLEEP:
+        time.sleep(seconds * SLEEP)
+
+
+def run_invoice_creation_demo():
+    emit(_BAR)
+    emit("🧾 FinAgent Pro — Conversational Invoice Demo")
+    emit(_BAR)
+    emit()
+
+    emit('💬 User: "Create an invoice for Acme Corp — 3 weeks of')
+    emit('         consulting at $2,500/week, net 30"')
+    flush()
+    pause(1)
+
+    emit()
+    emit("🤖 Step 1: Invoice Agent extracts structured details from chat...")
+    flush()
+    pause(2)
+
+    import httpx
+    import orjson
+
+    try:
+        response = _get_client().post(
+            "/api/v1/demo/invoices",
+            json={"description": "3 weeks of consulting for Acme Corp at $2500/week, net 30"}
+        )
+        response.raise_for_status()
+        # orjson decodes the payload several times faster than the stdlib
+        # json that response.json() would use
+        invoice = orjson.loads(response.content).get("invoice", {})
+        emit("✅ Backend created the invoice")
+    except httpx.ConnectError:
+        emit("⚠️  Backend not running — showing simulated agent output")
+        invoice_number, due_date = _fallback_dates()
+        invoice = {
+            "invoice_id": "inv_demo_001",
+            "invoice_number": invoice_number,
+            "customer": "Acme Corp",
+            "amount": 7500.00,
+            "currency": "USD",
+            "due_date": due_date,
+            "status": "created",
+            "pdf_url": "/api/v1/invoices/inv_demo_001/pdf",
+            "payment_url": "https://pay.example.com/demo"
+        }
+
+    emit()
+    emit("📄 Step 2: Generating branded PDF...")
+    flush()
+    pause(1)
+    emit(f"   PDF ready at {invoice.get('pdf_url')}")
+
+    emit()
+    emit("💳 Step 3: Creating Stripe payment link...")
+    flush()
+    pause(1)
+    emit(f"   Payment link: {invoice.get('payment_url')}")
+
+    _BUF.append(_INVOICE_SUMMARY.format_map({
+        "invoice_number": invoice.get("invoice_number"),
+        "customer": invoice.get("customer"),
+        "amount": invoice.get("amount"),
+        "currency": invoice.get("currency", "USD"),
+        "due_date": invoice.get("due_date"),
+        "status": invoice.get("status", "created").upper(),
+    }))
+    flush()
+
+
+def main():
+    try:
+        run_invoice_creation_demo()
+    finally:
+        if _CLIENT is not None:
+            _CLIENT.close()
+
+
+if __name__ == "__main__":
+    main()
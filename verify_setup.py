@@ -0,0 +1,188 @@
+"""
+FinAgent Pro - Setup Verification
+Checks the repo layout, Python environment and key dependencies before
+running the backend or the demos.
+Run: python verify_setup.py
+"""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+
+
+_BAR = "=" * 60
+
+
+def print_header(title):
+    print(f"{_BAR}\n{title}\n{_BAR}")
+
+
+# CI runs that only consume the exit code can skip all per-line output
+# (and the f-string formatting behind it) by setting VERIFY_QUIET=1
+_QUIET = not sys.stdout.isatty() and os.environ.get("VERIFY_QUIET") == "1"
+
+
+def print_status(label, ok, message=""):
+    if _QUIET:
+        return ok
+    icon = "✅" if ok else "❌"
+    suffix = f" — {message}" if message else ""
+    print(f"{icon} {label}{suffix}")
+    return ok
+
+
+def build_present_set():
+    """
+    Walk the tree once and remember every file path
+    A single os.scandir-driven traversal replaces one stat() syscall per
+    checked file (~30 of them) with in-memory set membership
+    """
+    present = set()
+    for root in ("backend", "frontend", "demos", "docker", "watsonx"):
+        if os.path.isdir(root):
+            present.update(
+                str(p).replace(os.sep, "/")
+                for p in Path(root).rglob("*")
+                if p.is_file()
+            )
+    present.update(p.name for p in Path(".").iterdir() if p.is_file())
+    return present
+
+
+# Required-file tuples live at module scope so they are built once at
+# import instead of reallocated on every check call
+BACKEND_FILES = (
+    "backend/main.py",
+    "backend/requirements.txt",
+    "backend/agents/orchestrator.py",
+    "backend/agents/expense_classifier.py",
+    "backend/agents/invoice_agent.py",
+    "backend/agents/fraud_analyzer.py",
+    "backend/agents/cashflow_forecast.py",
+    "backend/agents/smart_assistant.py",
+    "backend/models/schemas.py",
+    "backend/services/database.py",
+    "backend/services/auth.py",
+    "backend/services/huggingface_service.py",
+)
+
+FRONTEND_FILES = (
+    "frontend/package.json",
+    "frontend/index.html",
+    "frontend/src/App.tsx",
+    "frontend/src/main.tsx",
+)
+
+DEMO_FILES = (
+    "demos/expense_processing_demo.py",
+    "demos/invoice_creation_demo.py",
+    "demos/fraud_detection_demo.py",
+)
+
+
+def check_structure(required, present):
+    return [(filepath, filepath in present, "") for filepath in required]
+
+
+def check_backend_deps():
+    # find_spec only asks the import finders whether the package exists;
+    # it never executes the module body, so presence checks stay cheap
+    results = []
+    for name in ("fastapi", "uvicorn", "pydantic", "loguru", "orjson"):
+        if find_spec(name) is not None:
+            results.append((f"python package: {name}", True, ""))
+        else:
+            results.append((
+                f"python package: {name}",
+                False,
+                "pip install -r backend/requirements-demo.txt"
+            ))
+    return results
+
+
+def check_huggingface_deps():
+    # Importing transformers would drag in torch/tokenizers/safetensors —
+    # seconds of import time just to confirm presence; find_spec avoids
+    # executing any of it
+    results = []
+    for name in ("transformers", "torch"):
+        if find_spec(name) is not None:
+            results.append((f"python package: {name}", True, ""))
+        else:
+            # Optional: the backend falls back to API/simulated responses
+            results.append((
+                f"python package: {name} (optional)",
+                True,
+                "not installed - API mode"
+            ))
+    return results
+
+
+def check_nodejs():
+    label = "Node.js (for frontend)"
+    try:
+        result = subprocess.run(
+            ["node", "--version"], capture_output=True, text=True, timeout=2
+        )
+        return [(label, result.returncode == 0, result.stdout.strip())]
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return [(label, False, "not found - frontend will not build")]
+
+
+def check_env_file():
+    # os.path.isfile is one C-level stat; Path would allocate an object
+    # and go through several pure-Python layers for the same answer
+    if os.path.isfile("backend/.env"):
+        return [("backend/.env", True, "")]
+    # Not fatal: DEMO_MODE runs without secrets
+    return [("backend/.env", True, "missing - DEMO_MODE works without it")]
+
+
+def main():
+    # On an older interpreter none of the dependency probes below could
+    # succeed anyway, so fail fast before the disk walks and imports
+    if sys.version_info < (3, 11):
+        print(f"❌ Python 3.11+ required (found {sys.version.split()[0]})")
+        return 1
+
+    print_header("🔧 FinAgent Pro — Setup Verification")
+    present = build_present_set()
+
+    # The sections are independent, so run them on a small thread pool:
+    # the node fork/exec and the package imports overlap with the disk
+    # walks. Results are collected in submission order and printed
+    # sequentially, so output stays deterministic.
+    sections = [
+        ("Backend structure", lambda: check_structure(BACKEND_FILES, present)),
+        ("Frontend structure", lambda: check_structure(FRONTEND_FILES, present)),
+        ("Demo scripts", lambda: check_structure(DEMO_FILES, present)),
+        ("Backend dependencies", check_backend_deps),
+        ("Hugging Face dependencies", check_huggingface_deps),
+        ("Tooling", check_nodejs),
+        ("Environment", check_env_file),
+    ]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(fn) for _, fn in sections]
+        section_results = [f.result() for f in futures]
+
+    ok_overall = True
+    for (title, _), results in zip(sections, section_results):
+        print()
+        print_header(title)
+        for label, ok, message in results:
+            print_status(label, ok, message)
+            ok_overall = ok_overall and ok
+
+    print()
+    if ok_overall:
+        print("✅ Setup verified — you are ready to run FinAgent Pro")
+        return 0
+    print("❌ Some checks failed — see above")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())